@@ -0,0 +1,532 @@
+"""
+Load-testing harness for the Wayne Enterprises BI Dashboard API.
+
+Replays dashboard traffic against a running instance of ``main.py`` and sweeps
+the number of concurrent dashboard users, reporting throughput, latency
+percentiles, error rate and event-loop lag for each level as JSON.
+
+Usage:
+    python load_test.py --start-server --concurrency 1,2,4,8,16,32 --output report.json
+    python load_test.py --base-url http://127.0.0.1:8000 --mix endpoints
+
+Only the standard library is used so the harness runs from the same virtual
+environment as the backend without extra dependencies.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+API_ENDPOINTS = [
+    "/api/executive-summary",
+    "/api/financial-overview",
+    "/api/security-metrics",
+    "/api/rd-status",
+    "/api/supply-chain",
+    "/api/hr-analytics",
+]
+
+# "dashboard" mirrors frontend/app/dashboard/page.tsx: every page load fires all
+# six API calls at once and waits for the slowest (Promise.all). "endpoints"
+# issues one request at a time, picked at random with the given weights.
+MIXES = {
+    "dashboard": None,
+    "endpoints": {
+        "/api/executive-summary": 3,
+        "/api/financial-overview": 2,
+        "/api/security-metrics": 2,
+        "/api/rd-status": 1,
+        "/api/supply-chain": 1,
+        "/api/hr-analytics": 1,
+    },
+}
+
+HEALTH_ENDPOINT = "/health"
+
+# Failures other than timeouts that leave a connection unusable
+REQUEST_ERRORS = (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError)
+
+# Pause after such a failure so users do not spin on reconnects to a dead server
+ERROR_BACKOFF = 0.1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds for a list of durations in seconds"""
+    ordered = sorted(v * 1000 for v in values)
+    if not ordered:
+        return {"min": 0.0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "min": round(ordered[0], 3),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": round(percentile(ordered, 50), 3),
+        "p90": round(percentile(ordered, 90), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "p99": round(percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client connection over asyncio streams"""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.response_started = False
+
+    async def get(self, path: str) -> int:
+        """Send a GET request and return the response status code"""
+        try:
+            return await asyncio.wait_for(self._get_with_retry(path), self.timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    async def _get_with_retry(self, path: str) -> int:
+        """
+        Retry once on a fresh socket if a reused connection turns out stale.
+
+        Servers close idle keep-alive connections (uvicorn after 5s), which
+        only shows up when the next request gets no response at all. Browsers
+        silently reconnect in that case, so it is not counted as an error.
+        """
+        reused = self.writer is not None
+        try:
+            return await self._get(path)
+        except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as e:
+            partial = isinstance(e, asyncio.IncompleteReadError) and e.partial
+            if not reused or self.response_started or partial:
+                raise
+        self.close()
+        return await self._get(path)
+
+    async def _get(self, path: str) -> int:
+        self.response_started = False
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Accept: application/json\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        self.writer.write(request.encode("ascii"))
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        self.response_started = True
+        lines = head.decode("latin-1").split("\r\n")
+        status_line = lines[0].split(" ", 2)
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            raise ValueError(f"Malformed status line: {lines[0]!r}")
+        status = int(status_line[1])
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status
+
+    def close(self):
+        """Drop the underlying socket; the next request reconnects"""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+
+class LevelStats:
+    """Samples collected during the measurement window of one concurrency level"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.endpoint_latencies: Dict[str, List[float]] = {path: [] for path in API_ENDPOINTS}
+        self.endpoint_errors: Counter = Counter()
+        self.status_codes: Counter = Counter()
+        self.errors = 0
+        self.page_loads: List[float] = []
+        self.failed_page_loads = 0
+        self.server_lag: List[float] = []
+        self.probe_failures = 0
+        self.client_lag: List[float] = []
+        self.measuring = False
+
+    def record(self, path: str, elapsed: float, status: Optional[int], error: Optional[str]):
+        if not self.measuring:
+            return
+        self.latencies.append(elapsed)
+        self.endpoint_latencies[path].append(elapsed)
+        if status is not None:
+            self.status_codes[str(status)] += 1
+        else:
+            self.status_codes[error] += 1
+        if error is not None or status >= 400:
+            self.errors += 1
+            self.endpoint_errors[path] += 1
+
+
+class LoadTester:
+    """Runs closed-loop virtual dashboard users against the API"""
+
+    def __init__(self, base_url: str, mix: str, think_time: float, timeout: float, probe_interval: float):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError(f"Only plain http:// targets are supported, got {base_url}")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.mix = mix
+        self.think_time = think_time
+        self.timeout = timeout
+        self.probe_interval = probe_interval
+        self.health_baseline = 0.0
+
+    async def _request(self, conn: HttpConnection, path: str, stats: LevelStats) -> bool:
+        started = time.perf_counter()
+        status, error = None, None
+        try:
+            status = await conn.get(path)
+        except asyncio.TimeoutError:
+            error = "timeout"
+        except REQUEST_ERRORS as e:
+            error = type(e).__name__
+        stats.record(path, time.perf_counter() - started, status, error)
+        if error is not None and error != "timeout":
+            await asyncio.sleep(ERROR_BACKOFF)
+        return error is None and status < 400
+
+    async def _virtual_user(self, stats: LevelStats, stop: asyncio.Event):
+        """One dashboard user; browsers open up to six connections per host"""
+        connections = [HttpConnection(self.host, self.port, self.timeout) for _ in API_ENDPOINTS]
+        weights = MIXES[self.mix]
+        rng = random.Random()
+        try:
+            while not stop.is_set():
+                if weights is None:
+                    started = time.perf_counter()
+                    results = await asyncio.gather(
+                        *(self._request(conn, path, stats) for conn, path in zip(connections, API_ENDPOINTS))
+                    )
+                    if stats.measuring:
+                        if all(results):
+                            stats.page_loads.append(time.perf_counter() - started)
+                        else:
+                            stats.failed_page_loads += 1
+                else:
+                    path = rng.choices(list(weights), weights=list(weights.values()))[0]
+                    await self._request(connections[0], path, stats)
+                if self.think_time > 0:
+                    try:
+                        await asyncio.wait_for(stop.wait(), rng.expovariate(1 / self.think_time))
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            for conn in connections:
+                conn.close()
+
+    async def _probe_server_lag(self, stats: LevelStats, stop: asyncio.Event):
+        """
+        Estimate the server's event-loop lag from /health latency.
+
+        The health endpoint does no work, so any latency above the idle
+        baseline is time spent waiting for the server's event loop. Probes
+        that fail outright are counted separately rather than as lag.
+        """
+        conn = HttpConnection(self.host, self.port, self.timeout)
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    await conn.get(HEALTH_ENDPOINT)
+                except asyncio.TimeoutError:
+                    pass
+                except REQUEST_ERRORS:
+                    if stats.measuring:
+                        stats.probe_failures += 1
+                    await asyncio.sleep(self.probe_interval)
+                    continue
+                elapsed = time.perf_counter() - started
+                if stats.measuring:
+                    stats.server_lag.append(max(0.0, elapsed - self.health_baseline))
+                await asyncio.sleep(self.probe_interval)
+        finally:
+            conn.close()
+
+    async def _monitor_client_lag(self, stats: LevelStats, stop: asyncio.Event, interval: float = 0.01):
+        """Track how late the generator's own loop wakes up, to flag client saturation"""
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            if stats.measuring:
+                stats.client_lag.append(max(0.0, time.perf_counter() - started - interval))
+
+    async def measure_health_baseline(self, samples: int = 20) -> float:
+        """Median /health latency on an idle server"""
+        conn = HttpConnection(self.host, self.port, self.timeout)
+        timings = []
+        try:
+            for _ in range(samples):
+                started = time.perf_counter()
+                await conn.get(HEALTH_ENDPOINT)
+                timings.append(time.perf_counter() - started)
+        finally:
+            conn.close()
+        self.health_baseline = percentile(sorted(timings), 50)
+        return self.health_baseline
+
+    async def run_level(self, concurrency: int, duration: float, warmup: float) -> Dict:
+        """Run one concurrency level and return its report entry"""
+        stats = LevelStats()
+        stop = asyncio.Event()
+        tasks = [asyncio.create_task(self._virtual_user(stats, stop)) for _ in range(concurrency)]
+        tasks.append(asyncio.create_task(self._probe_server_lag(stats, stop)))
+        tasks.append(asyncio.create_task(self._monitor_client_lag(stats, stop)))
+
+        await asyncio.sleep(warmup)
+        stats.measuring = True
+        started = time.perf_counter()
+        await asyncio.sleep(duration)
+        stats.measuring = False
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return self._level_report(concurrency, elapsed, stats)
+
+    def _level_report(self, concurrency: int, elapsed: float, stats: LevelStats) -> Dict:
+        requests = len(stats.latencies)
+        ok = requests - stats.errors
+        report = {
+            "concurrency": concurrency,
+            "duration_s": round(elapsed, 3),
+            "requests": requests,
+            "errors": stats.errors,
+            "error_rate": round(stats.errors / requests, 4) if requests else 0.0,
+            "requests_per_sec": round(requests / elapsed, 2),
+            "successful_requests_per_sec": round(ok / elapsed, 2),
+            "latency_ms": summarize(stats.latencies),
+            "status_codes": dict(stats.status_codes),
+            "endpoints": {
+                path: {
+                    "requests": len(stats.endpoint_latencies[path]),
+                    "errors": stats.endpoint_errors[path],
+                    "latency_ms": summarize(stats.endpoint_latencies[path]),
+                }
+                for path in API_ENDPOINTS
+                if stats.endpoint_latencies[path]
+            },
+            "server_loop_lag_ms": summarize(stats.server_lag),
+            "server_probe_failures": stats.probe_failures,
+            "client_loop_lag_ms": summarize(stats.client_lag),
+        }
+        if self.mix == "dashboard":
+            report["page_loads"] = len(stats.page_loads)
+            report["failed_page_loads"] = stats.failed_page_loads
+            report["page_loads_per_sec"] = round(len(stats.page_loads) / elapsed, 2)
+            report["page_load_ms"] = summarize(stats.page_loads)
+        return report
+
+
+def find_saturation(levels: List[Dict], plateau: float = 0.95, collapse: float = 0.8) -> Dict:
+    """
+    Locate the throughput knee and collapse point across a sweep.
+
+    The knee is the lowest concurrency reaching ``plateau`` of peak throughput;
+    collapse is the first level past the peak whose throughput falls below
+    ``collapse`` of peak.
+    """
+    if not levels:
+        return {}
+    peak = max(levels, key=lambda level: level["successful_requests_per_sec"])
+    peak_rps = peak["successful_requests_per_sec"]
+    if peak_rps <= 0:
+        return {
+            "peak_requests_per_sec": 0.0,
+            "peak_concurrency": None,
+            "knee_concurrency": None,
+            "collapse_concurrency": None,
+        }
+    knee = next(
+        level["concurrency"] for level in levels
+        if level["successful_requests_per_sec"] >= plateau * peak_rps
+    )
+    collapse_at = next(
+        (
+            level["concurrency"] for level in levels
+            if level["concurrency"] > peak["concurrency"]
+            and level["successful_requests_per_sec"] < collapse * peak_rps
+        ),
+        None,
+    )
+    return {
+        "peak_requests_per_sec": peak_rps,
+        "peak_concurrency": peak["concurrency"],
+        "knee_concurrency": knee,
+        "collapse_concurrency": collapse_at,
+    }
+
+
+def wait_for_server(base_url: str, timeout: float, process: Optional[subprocess.Popen] = None):
+    """Poll /health until the server answers or ``timeout`` elapses"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server process exited with code {process.returncode} before becoming healthy")
+        try:
+            with urllib.request.urlopen(f"{base_url}{HEALTH_ENDPOINT}", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy within {timeout}s")
+
+
+def port_in_use(host: str, port: int) -> bool:
+    """Whether something is already accepting connections on ``host:port``"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(1)
+        return sock.connect_ex((host, port)) == 0
+
+
+def start_server(host: str, port: int) -> subprocess.Popen:
+    """Launch a single uvicorn worker serving main:app from the backend folder"""
+    if port_in_use(host, port):
+        raise RuntimeError(f"{host}:{port} is already in use; stop that server or pick another --base-url")
+    command = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", host, "--port", str(port),
+        "--workers", "1", "--log-level", "warning", "--no-access-log",
+    ]
+    logger.info(f"Starting server: {' '.join(command)}")
+    return subprocess.Popen(command, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_levels(value: str) -> List[int]:
+    levels = sorted({int(item) for item in value.split(",") if item.strip()})
+    if not levels or levels[0] < 1:
+        raise argparse.ArgumentTypeError("concurrency levels must be positive integers")
+    return levels
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Concurrency sweep load test for the BI Dashboard API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="API base URL")
+    parser.add_argument("--start-server", action="store_true",
+                        help="start a single uvicorn worker for main:app at --base-url and stop it afterwards")
+    parser.add_argument("--concurrency", type=parse_levels, default=parse_levels("1,2,4,8,16,32,64"),
+                        help="comma-separated concurrent user counts to sweep")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each level")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="dashboard", help="traffic mix to replay")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="mean seconds a user pauses between actions (0 = closed loop, no pause)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--probe-interval", type=float, default=0.1, help="seconds between /health lag probes")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="stop the sweep after a level exceeds this error rate (0-1)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+async def run_sweep(args: argparse.Namespace) -> Dict:
+    tester = LoadTester(args.base_url, args.mix, args.think_time, args.timeout, args.probe_interval)
+    baseline = await tester.measure_health_baseline()
+    logger.info(f"Idle /health latency: {baseline * 1000:.2f} ms")
+
+    levels = []
+    for concurrency in args.concurrency:
+        level = await tester.run_level(concurrency, args.duration, args.warmup)
+        levels.append(level)
+        logger.info(
+            f"users={concurrency:>4}  rps={level['requests_per_sec']:>8.1f}  "
+            f"p50={level['latency_ms']['p50']:>8.1f}ms  p99={level['latency_ms']['p99']:>8.1f}ms  "
+            f"errors={level['error_rate'] * 100:5.1f}%  "
+            f"loop_lag_p99={level['server_loop_lag_ms']['p99']:>7.1f}ms"
+        )
+        if args.max_error_rate is not None and level["error_rate"] > args.max_error_rate:
+            logger.info(f"Error rate above {args.max_error_rate:.2%}, stopping sweep")
+            break
+
+    return {
+        "target": args.base_url,
+        "config": {
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "think_time_s": args.think_time,
+            "timeout_s": args.timeout,
+        },
+        "started_server": args.start_server,
+        "health_baseline_ms": round(baseline * 1000, 3),
+        "levels": levels,
+        "saturation": find_saturation(levels),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    server = None
+    if args.start_server:
+        parts = urlsplit(args.base_url)
+        server = start_server(parts.hostname or "127.0.0.1", parts.port or 8000)
+    try:
+        wait_for_server(args.base_url, timeout=60 if server else 5, process=server)
+        report = asyncio.run(run_sweep(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+
+import pytest
+
+from load_test import (
+    HttpConnection, LevelStats, LoadTester,
+    find_saturation, parse_levels, percentile, summarize,
+)
+
+
+def serve_once(response: bytes):
+    """Stub server that answers each connection's first request, then closes it"""
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(response)
+        await writer.drain()
+        writer.close()
+    return asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def request(response: bytes, count: int):
+    """Issue ``count`` requests over one connection and return the recorded stats"""
+    server = await serve_once(response)
+    port = server.sockets[0].getsockname()[1]
+    tester = LoadTester(f"http://127.0.0.1:{port}", "endpoints", 0, 2, 0.1)
+    conn = HttpConnection("127.0.0.1", port, 2)
+    stats = LevelStats()
+    stats.measuring = True
+    results = []
+    try:
+        for _ in range(count):
+            results.append(await tester._request(conn, "/api/rd-status", stats))
+            await asyncio.sleep(0.05)
+    finally:
+        conn.close()
+        server.close()
+        await server.wait_closed()
+    return results, stats
+
+
+def sweep(*points):
+    return [{"concurrency": c, "successful_requests_per_sec": rps} for c, rps in points]
+
+
+@pytest.mark.parametrize("n, pct, expected", [
+    (10, 50, 5),
+    (20, 50, 10),
+    (100, 50, 50),
+    (100, 95, 95),
+    (100, 99, 99),
+    (100, 100, 100),
+    (10, 0, 1),
+    (1, 99, 1),
+])
+def test_percentile_nearest_rank(n, pct, expected):
+    assert percentile(list(range(1, n + 1)), pct) == expected
+
+
+def test_percentile_empty():
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_converts_to_milliseconds():
+    summary = summarize([i / 1000 for i in range(1, 101)])
+    assert summary["min"] == 1.0
+    assert summary["max"] == 100.0
+    assert summary["mean"] == 50.5
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (50.0, 95.0, 99.0)
+
+
+def test_summarize_empty():
+    assert set(summarize([]).values()) == {0.0}
+
+
+def test_find_saturation_monotonic_sweep():
+    result = find_saturation(sweep((1, 50), (2, 90), (4, 97), (8, 100)))
+    assert result["peak_concurrency"] == 8
+    assert result["knee_concurrency"] == 4
+    assert result["collapse_concurrency"] is None
+
+
+def test_find_saturation_collapse():
+    result = find_saturation(sweep((1, 60), (2, 100), (4, 90), (8, 70), (16, 20)))
+    assert result["peak_requests_per_sec"] == 100
+    assert result["peak_concurrency"] == 2
+    assert result["knee_concurrency"] == 2
+    assert result["collapse_concurrency"] == 8
+
+
+def test_find_saturation_zero_throughput():
+    result = find_saturation(sweep((1, 0), (2, 0)))
+    assert result["peak_requests_per_sec"] == 0.0
+    assert result["knee_concurrency"] is None
+    assert result["collapse_concurrency"] is None
+
+
+def test_find_saturation_empty():
+    assert find_saturation([]) == {}
+
+
+def test_parse_levels_sorts_and_dedupes():
+    assert parse_levels("8, 1,2,8") == [1, 2, 8]
+
+
+@pytest.mark.parametrize("value", ["", "0,1", "-4"])
+def test_parse_levels_rejects_non_positive(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_levels(value)
+
+
+def test_request_reconnects_after_idle_close():
+    response = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}"
+    results, stats = asyncio.run(request(response, 2))
+    assert results == [True, True]
+    assert stats.errors == 0
+    assert dict(stats.status_codes) == {"200": 2}
+
+
+def test_request_records_malformed_status_line():
+    results, stats = asyncio.run(request(b"garbage\r\n\r\n", 1))
+    assert results == [False]
+    assert stats.errors == 1
+    assert dict(stats.status_codes) == {"ValueError": 1}
+
+
+def test_request_reads_chunked_body():
+    response = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n2\r\n{}\r\n0\r\n\r\n"
+    results, stats = asyncio.run(request(response, 2))
+    assert results == [True, True]
+    assert stats.errors == 0